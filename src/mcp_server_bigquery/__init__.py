@@ -22,34 +22,74 @@ def main():
     parser.add_argument(
         "--port", help="Port for HTTP transport", type=int, default=None
     )
+    parser.add_argument(
+        "--cache-ttl",
+        help="Seconds to cache table metadata (0 disables caching)",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "--max-bytes-billed",
+        help="Maximum bytes billed per query (queries above it fail)",
+        type=int,
+        default=None,
+    )
 
     args = parser.parse_args()
 
+    # Snapshot the environment once instead of querying os.environ per setting
+    env = dict(os.environ)
+
     # Get values from environment variables if not provided as arguments
-    project = args.project or os.environ.get("BIGQUERY_PROJECT")
-    location = args.location or os.environ.get("BIGQUERY_LOCATION")
-    key_file = args.key_file or os.environ.get("BIGQUERY_KEY_FILE")
-    transport = args.transport or os.environ.get("MCP_TRANSPORT", "stdio")
+    project = args.project or env.get("BIGQUERY_PROJECT")
+    location = args.location or env.get("BIGQUERY_LOCATION")
+    key_file = args.key_file or env.get("BIGQUERY_KEY_FILE")
+    transport = args.transport or env.get("MCP_TRANSPORT", "stdio")
 
-    # Get port from args, env var, or Cloud Run's PORT
+    # Get port from args, Cloud Run's PORT, or MCP_PORT (default: 8080)
     if args.port is not None:
         port = args.port
-    elif "PORT" in os.environ:
-        port = int(os.environ.get("PORT"))
-    elif "MCP_PORT" in os.environ:
-        port = int(os.environ.get("MCP_PORT"))
     else:
-        port = 8080  # Default port
+        port = int(env.get("PORT") or env.get("MCP_PORT") or 8080)
+
+    # Get metadata cache lifetime from args or env var
+    if args.cache_ttl is not None:
+        cache_ttl = args.cache_ttl
+    else:
+        cache_ttl = float(env.get("BIGQUERY_CACHE_TTL") or server.DEFAULT_CACHE_TTL)
+
+    # Get the per-query cost limit from args or env var (default: no limit)
+    if args.max_bytes_billed is not None:
+        max_bytes_billed = args.max_bytes_billed
+    else:
+        raw_max_bytes = env.get("BIGQUERY_MAX_BYTES_BILLED")
+        max_bytes_billed = int(raw_max_bytes) if raw_max_bytes else None
 
     datasets_filter = args.dataset if args.dataset else []
-    if not datasets_filter and "BIGQUERY_DATASETS" in os.environ:
-        datasets_filter = os.environ.get("BIGQUERY_DATASETS", "").split(",")
-        datasets_filter = [d.strip() for d in datasets_filter if d.strip()]
+    if not datasets_filter:
+        raw_datasets = env.get("BIGQUERY_DATASETS", "")
+        datasets_filter = [d for d in map(str.strip, raw_datasets.split(",")) if d]
 
-    asyncio.run(
-        server.main(project, location, key_file, datasets_filter, transport, port)
+    coro = server.main(
+        project,
+        location,
+        key_file,
+        datasets_filter,
+        transport,
+        port,
+        cache_ttl,
+        max_bytes_billed,
     )
 
+    # Prefer uvloop's libuv-based event loop; fall back to the stdlib loop
+    # where it is unavailable (e.g. on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
+
 
 # Optionally expose other important items at package level
 __all__ = ["main", "server"]
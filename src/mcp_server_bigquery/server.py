@@ -14,16 +14,33 @@ Key features:
 - Dual transport support (stdio for local, HTTP/SSE for cloud deployment)
 """
 
-from google.cloud import bigquery
-from google.oauth2 import service_account
+import asyncio
+import atexit
+import base64
+import concurrent.futures
+import itertools
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import re
+import threading
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
-from starlette.applications import Starlette
-from mcp.server.sse import SseServerTransport
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Iterator
+
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    from google.cloud.bigquery.query import _AbstractQueryParameter
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
 
 # ============================================================================
 # Logging Configuration
@@ -31,6 +48,10 @@ from typing import Any, Optional
 # Configure dual logging to both stdout (for container logs) and a file
 # (for debugging). This ensures logs are visible in both local development
 # and containerized deployments.
+#
+# The handlers are driven by a QueueListener on a background thread, so log
+# calls on the request path only enqueue records and never block the event
+# loop on console or disk I/O.
 
 logger = logging.getLogger("mcp_bigquery_server")
 
@@ -45,15 +66,172 @@ formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(messag
 handler_stdout.setFormatter(formatter)
 handler_file.setFormatter(formatter)
 
-# Attach both handlers to the logger
-logger.addHandler(handler_stdout)
-logger.addHandler(handler_file)
-
-# Set to DEBUG to capture detailed execution information
-logger.setLevel(logging.DEBUG)
+# Attach both handlers to the logger through a queue
+log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+# respect_handler_level keeps per-handler levels in effect on the listener side
+log_listener = logging.handlers.QueueListener(
+    log_queue, handler_stdout, handler_file, respect_handler_level=True
+)
+log_listener.start()
+# Flush pending records on interpreter shutdown
+atexit.register(log_listener.stop)
+
+# Defaults to INFO; set MCP_LOG_LEVEL=DEBUG to capture detailed execution
+# information. Unknown level names fall back to INFO rather than failing the
+# import, which would also break --help.
+log_level = os.environ.get("MCP_LOG_LEVEL", "INFO").upper()
+if log_level in logging.getLevelNamesMapping():
+    logger.setLevel(log_level)
+else:
+    logger.setLevel(logging.INFO)
+    logger.warning("Invalid MCP_LOG_LEVEL %r, using INFO", log_level)
 
 logger.info("Starting MCP BigQuery Server")
 
+# Default lifetime (in seconds) of cached table listings and table descriptions
+DEFAULT_CACHE_TTL = 300.0
+
+# Result sets with at least this many rows are downloaded through the BigQuery
+# Storage Read API (if installed) instead of paginated REST calls
+STORAGE_API_MIN_ROWS = 10_000
+
+# Page size for REST dataset listings. Small pages let the per-dataset table
+# listings start while further dataset pages are still being fetched.
+LIST_DATASETS_PAGE_SIZE = 100
+
+# Page size for REST table listings. The API default is 50 tables per page;
+# requesting the maximum of 1000 cuts the number of round trips per dataset.
+LIST_TABLES_PAGE_SIZE = 1000
+
+# Maximum number of pooled HTTPS connections to the BigQuery API, i.e. the
+# number of REST calls that can be in flight at the same time
+HTTP_POOL_SIZE = 64
+
+# Parameters of a parameterized query (ScalarQueryParameter, ArrayQueryParameter,
+# ...), as accepted by QueryJobConfig.query_parameters
+QueryParams = list["_AbstractQueryParameter"]
+
+# Size of the thread pool running blocking BigQuery calls (queries, listings).
+# asyncio's default of min(32, cpu_count + 4) leaves only 5 threads on a
+# single-CPU container, although the threads mostly wait on network I/O.
+WORKER_THREADS = 32
+
+# Number of rows serialized into each text content item of an execute-query
+# result. Rows are encoded chunk by chunk as they are fetched, so only one
+# chunk of rows is alive at a time.
+RESULT_CHUNK_ROWS = 1000
+
+# Maximum number of table descriptions kept in memory; the least recently used
+# entries are evicted first once the cache is full
+DDL_CACHE_SIZE = 1024
+
+# Key of the single entry in the table listing cache
+_TABLES_CACHE_KEY = "tables"
+
+# Project IDs consist of ASCII letters, digits and hyphens. The project is the
+# only part of a table name that is interpolated into query text (as the
+# INFORMATION_SCHEMA view's project), so it is checked strictly before use.
+_PROJECT_ID_RE = re.compile(r"[A-Za-z0-9-]+")
+
+# Dataset IDs consist of ASCII letters, digits and underscores. They are bound
+# as parameters, except when falling back to a dataset-qualified
+# INFORMATION_SCHEMA view, which requires an ID matching this pattern.
+_DATASET_ID_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+def _parse_table_name(table_name: str) -> tuple[str | None, str, str]:
+    """
+    Split a '[project.]dataset.table' name into its validated parts.
+
+    Dataset and table IDs are only ever passed to BigQuery as query parameters,
+    so they are accepted as-is (table IDs may contain Unicode letters, marks,
+    dashes and spaces); only empty segments are rejected.
+
+    Returns:
+        Tuple of (project_id or None, dataset_id, table_id)
+
+    Raises:
+        ValueError: If the name does not have two or three non-empty segments,
+                   or the project ID contains characters outside _PROJECT_ID_RE
+    """
+    parts = table_name.split(".")
+    if len(parts) == 2:
+        project_id = None
+        dataset_id, table_id = parts
+    elif len(parts) == 3:
+        project_id, dataset_id, table_id = parts
+        if _PROJECT_ID_RE.fullmatch(project_id) is None:
+            raise ValueError(f"Invalid table name: {table_name}")
+    else:
+        raise ValueError(f"Invalid table name: {table_name}")
+    if not dataset_id or not table_id:
+        raise ValueError(f"Invalid table name: {table_name}")
+    return project_id, dataset_id, table_id
+
+
+# Query for the DDL of one table, formatted with a project's regional
+# INFORMATION_SCHEMA.TABLES view; dataset and table are bound as parameters
+_DESCRIBE_TABLE_SQL = """
+    SELECT ddl
+    FROM {info_schema}
+    WHERE table_schema = @dataset_id AND table_name = @table_name;
+"""
+
+# Query for the DDL of several tables of one project. The table_schema filter
+# limits the scan to the datasets involved; the 'dataset.table' match selects
+# the requested tables across those datasets.
+_DESCRIBE_TABLES_SQL = """
+    SELECT CONCAT(table_schema, '.', table_name) AS fqn, ddl
+    FROM {info_schema}
+    WHERE table_schema IN UNNEST(@datasets)
+      AND CONCAT(table_schema, '.', table_name) IN UNNEST(@tables);
+"""
+
+
+# ============================================================================
+# Result Serialization
+# ============================================================================
+# Tool results are returned to the LLM as JSON. orjson is used when available
+# since it serializes in C; the stdlib json module is the fallback.
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert BigQuery values that JSON encoders do not support natively.
+
+    Handles DATE/TIME/DATETIME/TIMESTAMP (ISO 8601), BYTES (base64) and
+    NUMERIC/BIGNUMERIC (string, to preserve precision).
+    """
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode("ascii")
+    return str(value)
+
+
+def _to_json(obj: Any) -> str:
+    """
+    Serialize a tool result to a JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default).decode()
+    return json.dumps(obj, default=_json_default)
+
+
+def _to_ndjson_chunks(rows: Iterable[Any], chunk_rows: int) -> list[str]:
+    """
+    Serialize rows to newline-delimited JSON, chunk_rows rows per string.
+
+    Rows are consumed incrementally, so a lazy row iterator is never
+    materialized as a whole. An empty input yields a single empty string.
+    """
+    chunks = [
+        "\n".join(_to_json(row) for row in batch)
+        for batch in itertools.batched(rows, chunk_rows)
+    ]
+    return chunks or [""]
+
 
 class BigQueryDatabase:
     """
@@ -66,12 +244,33 @@ class BigQueryDatabase:
     for common operations needed by the MCP server.
     """
 
+    # Instances carry a fixed set of attributes, so they are stored in slots
+    # rather than a per-instance __dict__
+    __slots__ = (
+        "client",
+        "datasets_filter",
+        "max_bytes_billed",
+        "_credentials",
+        "_bqstorage_client",
+        "_region",
+        "_info_schema",
+        "_list_tables_query",
+        "_list_tables_params",
+        "_describe_table_query",
+        "_tables_cache",
+        "_ddl_cache",
+        "_cache_lock",
+        "_regional_forbidden",
+    )
+
     def __init__(
         self,
         project: str,
         location: str,
-        key_file: Optional[str],
+        key_file: str | None,
         datasets_filter: list[str],
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_bytes_billed: int | None = None,
     ):
         """
         Initialize a BigQuery database client.
@@ -83,21 +282,35 @@ class BigQueryDatabase:
                      If None, uses Application Default Credentials (ADC)
             datasets_filter: List of dataset names to restrict access to.
                            If empty, all datasets in the project are accessible.
+            cache_ttl: Seconds for which table listings and table descriptions
+                      are served from memory. Use 0 to disable caching.
+            max_bytes_billed: Upper limit of bytes billed for queries run through
+                             execute_query. Queries exceeding it fail without
+                             being charged. If None, no limit is applied.
 
         Raises:
             ValueError: If project or location is not provided, or if key_file is invalid
         """
         logger.info(
-            f"Initializing BigQuery client for project: {project}, location: {location}, key_file: {key_file}"
+            "Initializing BigQuery client for project: %s, location: %s, key_file: %s",
+            project,
+            location,
+            key_file,
         )
         if not project:
             raise ValueError("Project is required")
         if not location:
             raise ValueError("Location is required")
 
+        # The BigQuery client library is imported on first use to keep module
+        # import (and thereby CLI startup) fast
+        from google.cloud import bigquery
+
         # Initialize credentials - either from service account key file or ADC
-        credentials: service_account.Credentials | None = None
+        credentials = None
         if key_file:
+            from google.oauth2 import service_account
+
             try:
                 # Load service account credentials from JSON key file
                 credentials_path = key_file
@@ -106,7 +319,7 @@ class BigQueryDatabase:
                     scopes=["https://www.googleapis.com/auth/cloud-platform"],
                 )
             except Exception as e:
-                logger.error(f"Error loading service account credentials: {e}")
+                logger.error("Error loading service account credentials: %s", e)
                 raise ValueError(f"Invalid key file: {e}")
 
         # Create BigQuery client with provided or default credentials
@@ -115,95 +328,447 @@ class BigQueryDatabase:
             credentials=credentials, project=project, location=location
         )
 
+        # requests keeps at most 10 connections per host by default, so
+        # concurrent tool calls would queue for a connection to the BigQuery
+        # API. Mount a larger pool unless the session uses its own mTLS
+        # adapter.
+        session = self.client._http
+        if not getattr(session, "is_mtls", False):
+            from requests.adapters import HTTPAdapter
+
+            session.mount("https://", HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+
+        # Optional BigQuery Storage Read API client for large result sets,
+        # created on first use (see _get_bqstorage_client). Set to False once
+        # the API turns out not to be permitted for these credentials.
+        self._credentials = credentials
+        self._bqstorage_client = None
+
         # Store dataset filter for restricting table access
         self.datasets_filter = datasets_filter
 
-    def execute_query(
-        self, query: str, params: dict[str, Any] | None = None
-    ) -> list[dict[str, Any]]:
+        # Cost limit for user queries; metadata queries are not limited
+        self.max_bytes_billed = max_bytes_billed
+
+        # Region-qualified INFORMATION_SCHEMA view covering all datasets of the
+        # project in the configured location
+        self._region = f"region-{location.lower()}"
+        self._info_schema = self._project_info_schema(project)
+
+        # The dataset filter is fixed for the lifetime of the server, so the
+        # table listing query and its parameters are built only once
+        self._list_tables_query = f"""
+            SELECT table_schema, table_name
+            FROM {self._info_schema}
+            WHERE table_schema IN UNNEST(@datasets)
+            ORDER BY table_schema, table_name;
+        """
+        self._list_tables_params = [
+            bigquery.ArrayQueryParameter("datasets", "STRING", datasets_filter),
+        ]
+
+        # Describe query for tables of the client project ('dataset.table')
+        self._describe_table_query = _DESCRIBE_TABLE_SQL.format(
+            info_schema=self._info_schema
+        )
+
+        # Metadata caches whose entries expire cache_ttl seconds after being
+        # stored. The table listing is kept under a single key, descriptions
+        # are keyed by table name. Describe calls run in worker threads, so
+        # all cache access is serialized through _cache_lock.
+        self._tables_cache: TTLCache = TTLCache(maxsize=1, ttl=cache_ttl)
+        self._ddl_cache: TTLCache = TTLCache(maxsize=DDL_CACHE_SIZE, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+
+        # Projects whose regional INFORMATION_SCHEMA view raised Forbidden.
+        # Permissions rarely change while the server runs, so metadata lookups
+        # for these projects go straight to the per-dataset fallbacks instead
+        # of paying a failing query every time. Guarded by _cache_lock.
+        self._regional_forbidden: set[str] = set()
+
+    def invalidate(self) -> None:
+        """
+        Drop all cached table listings and table descriptions, and retry the
+        regional INFORMATION_SCHEMA views of projects where they were not
+        accessible.
+        """
+        logger.debug("Invalidating metadata caches")
+        with self._cache_lock:
+            self._tables_cache.clear()
+            self._ddl_cache.clear()
+            self._regional_forbidden.clear()
+
+    def _regional_view_forbidden(self, project_id: str | None) -> bool:
+        """
+        Return whether the regional view of a project (None for the client
+        project) is known to raise Forbidden.
+        """
+        with self._cache_lock:
+            return (project_id or self.client.project) in self._regional_forbidden
+
+    def _mark_regional_view_forbidden(
+        self, project_id: str | None, error: Exception, fallback: str
+    ) -> None:
+        """
+        Remember that the regional view of a project raised Forbidden, logging
+        it the first time.
+
+        Args:
+            project_id: Project of the view, or None for the client project
+            error: The Forbidden error raised by the query
+            fallback: Description of the fallback used instead, for the log
+        """
+        project = project_id or self.client.project
+        with self._cache_lock:
+            first = project not in self._regional_forbidden
+            self._regional_forbidden.add(project)
+        if first:
+            # Typical for credentials that are only granted individual datasets
+            logger.info(
+                "Regional INFORMATION_SCHEMA of project %s not accessible, %s: %s",
+                project,
+                fallback,
+                error,
+            )
+
+    def _get_bqstorage_client(self) -> Any:
+        """
+        Return the BigQuery Storage Read API client, creating it on first use.
+
+        Returns:
+            A BigQueryReadClient, or None if the optional 'bqstorage' extra
+            (google-cloud-bigquery-storage, pyarrow) is not installed or the
+            Storage Read API has been disabled after a permission error
+        """
+        if self._bqstorage_client is False:
+            return None
+        if self._bqstorage_client is None:
+            try:
+                from google.cloud import bigquery_storage
+            except ImportError:
+                return None
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient(
+                credentials=self._credentials
+            )
+        return self._bqstorage_client
+
+    async def execute_query(
+        self,
+        query: str,
+        params: QueryParams | None = None,
+        chunk_rows: int = RESULT_CHUNK_ROWS,
+    ) -> list[str]:
+        """
+        Execute a SQL query and return its results as newline-delimited JSON.
+
+        Results are column-oriented: the first line is the array of column
+        names, followed by one JSON array of values per row, so column names
+        are not repeated for every row. The query, the fetching of result
+        pages and the serialization all run in one worker thread, so rows are
+        encoded chunk by chunk as pages arrive and the full list of rows is
+        never built; the event loop stays free meanwhile.
+
+        Args:
+            query: SQL query string to execute (BigQuery SQL dialect)
+            params: Optional list of query parameters (e.g. ScalarQueryParameter)
+                   for parameterized queries
+            chunk_rows: Number of lines (header included) per returned chunk
+
+        Returns:
+            List of NDJSON strings of up to chunk_rows lines each
+
+        Raises:
+            Exception: If query execution fails (e.g., syntax error, permission denied,
+                       or max_bytes_billed exceeded)
         """
-        Execute a SQL query and return results as a list of dictionaries.
+
+        def run() -> list[str]:
+            try:
+                columns, rows = self._execute_query_columnar(
+                    query, params, self.max_bytes_billed
+                )
+                return _to_ndjson_chunks(itertools.chain([columns], rows), chunk_rows)
+            except Exception as e:
+                # Only user queries are logged as errors; failing metadata
+                # queries are often expected and handled by their callers
+                logger.error("Database error executing query: %s", e)
+                raise
+
+        return await asyncio.to_thread(run)
+
+    def _execute_query_blocking(
+        self, query: str, params: QueryParams | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Execute a metadata query and return an iterator over the result rows
+        as dictionaries (blocking). No max_bytes_billed limit is applied.
 
         Args:
             query: SQL query string to execute (BigQuery SQL dialect)
-            params: Optional dictionary of query parameters for parameterized queries
+            params: Optional list of query parameters (e.g. ScalarQueryParameter)
+                   for parameterized queries
 
         Returns:
-            List of dictionaries, where each dictionary represents a row with
+            Iterator of dictionaries, where each dictionary represents a row with
             column names as keys and cell values as values
 
         Raises:
             Exception: If query execution fails (e.g., syntax error, permission denied)
         """
-        logger.debug(f"Executing query: {query}")
-        try:
-            if params:
-                # Execute parameterized query for security (prevents SQL injection)
-                job = self.client.query(
-                    query, job_config=bigquery.QueryJobConfig(query_parameters=params)
-                )
-            else:
-                # Execute simple query without parameters
-                job = self.client.query(query)
+        columns, rows = self._execute_query_columnar(query, params)
+        return (dict(zip(columns, values)) for values in rows)
 
-            # Wait for query to complete and fetch results
-            results = job.result()
+    def _execute_query_columnar(
+        self,
+        query: str,
+        params: QueryParams | None = None,
+        max_bytes_billed: int | None = None,
+    ) -> tuple[list[str], Iterator[tuple[Any, ...]]]:
+        """
+        Execute a SQL query and return its column names and row values (blocking).
 
-            # Convert BigQuery Row objects to standard Python dictionaries
-            rows = [dict(row.items()) for row in results]
-            logger.debug(f"Query returned {len(rows)} rows")
-            return rows
-        except Exception as e:
-            logger.error(f"Database error executing query: {e}")
-            raise
+        The query is run to completion before this method returns, but result
+        pages are only fetched from BigQuery as the iterator is consumed, so the
+        full result set is never materialized as Python objects at once.
+        Results of at least STORAGE_API_MIN_ROWS rows are streamed as Arrow
+        record batches through the Storage Read API when it is installed.
 
-    def list_tables(self) -> list[str]:
+        Args:
+            query: SQL query string to execute (BigQuery SQL dialect)
+            params: Optional list of query parameters (e.g. ScalarQueryParameter)
+                   for parameterized queries
+            max_bytes_billed: Optional upper limit of bytes billed for the query.
+                             BigQuery rejects queries whose estimate exceeds it
+                             before running them, so no dry run is needed.
+
+        Returns:
+            Tuple of the result's column names and an iterator of value tuples,
+            one per row, in column order
+
+        Raises:
+            Exception: If query execution fails (e.g., syntax error, permission denied)
+        """
+        from google.cloud import bigquery
+
+        logger.debug("Executing query: %s", query)
+        # Parameterized queries (prevents SQL injection) and cost-limited
+        # queries need a job config; plain queries are sent without one
+        job_config = None
+        if params or max_bytes_billed is not None:
+            job_config = bigquery.QueryJobConfig(query_parameters=params or [])
+            if max_bytes_billed is not None:
+                job_config.maximum_bytes_billed = max_bytes_billed
+
+        # query_and_wait uses the synchronous jobs.query endpoint where
+        # possible, which returns the first page of results in the same
+        # round trip instead of jobs.insert followed by polling. Further
+        # pages are fetched on iteration.
+        results = self.client.query_and_wait(query, job_config=job_config)
+        # total_rows is None for scripts and DDL statements
+        logger.debug("Query returned %s rows", results.total_rows)
+
+        columns = [field.name for field in results.schema]
+
+        if (results.total_rows or 0) >= STORAGE_API_MIN_ROWS:
+            bqstorage_client = self._get_bqstorage_client()
+            if bqstorage_client is not None:
+                # Stream Arrow record batches over gRPC; decoding happens in C++
+                from google.api_core.exceptions import Forbidden, PermissionDenied
+
+                logger.debug("Fetching results via the BigQuery Storage Read API")
+                batches = results.to_arrow_iterable(bqstorage_client=bqstorage_client)
+                try:
+                    # The read session is created when the first batch is
+                    # requested, which is where missing permissions surface
+                    first = next(batches, None)
+                except (PermissionDenied, Forbidden) as e:
+                    if self._bqstorage_client is not False:
+                        logger.warning(
+                            "BigQuery Storage Read API not permitted, "
+                            "falling back to the REST API: %s",
+                            e,
+                        )
+                    self._bqstorage_client = False
+                    # to_arrow_iterable has already started the row iterator,
+                    # so the rows are read again from the destination table
+                    results = self.client.list_rows(
+                        results._table, selected_fields=results.schema
+                    )
+                else:
+                    return columns, (
+                        values
+                        for batch in itertools.chain(
+                            [first] if first is not None else [], batches
+                        )
+                        for values in zip(
+                            *(column.to_pylist() for column in batch.columns)
+                        )
+                    )
+
+        # Rows hold their cells in a plain tuple. Reading it directly avoids
+        # Row.values(), which deep-copies every cell, and iterating the Row,
+        # which goes through a Python-level __getitem__ per cell.
+        return columns, (row._xxx_values for row in results)
+
+    async def list_tables(self, refresh: bool = False) -> list[str]:
         """
         List all tables accessible in the BigQuery project.
 
         If datasets_filter is configured, only tables from those datasets are returned.
         Otherwise, all tables from all datasets in the project are listed.
 
+        Args:
+            refresh: If True, bypass the cache and fetch a fresh listing
+
         Returns:
             List of fully-qualified table names in format 'dataset_id.table_id'
 
+        Raises:
+            NotFound: If a dataset in datasets_filter does not exist
+
         Note:
-            This method may be slow for projects with many datasets/tables.
-            Consider using datasets_filter to improve performance.
+            With a datasets_filter, all tables are fetched with a single query
+            against the regional INFORMATION_SCHEMA where possible (see
+            _list_filtered_tables). Without a filter, each
+            dataset requires its own BigQuery API call; these calls are issued
+            concurrently in the default executor as soon as each page of the
+            dataset listing arrives, so latency is bounded by the slowest
+            dataset rather than the sum over all datasets.
+            Results are cached for cache_ttl seconds.
         """
+        if not refresh:
+            with self._cache_lock:
+                cached = self._tables_cache.get(_TABLES_CACHE_KEY)
+            if cached is not None:
+                logger.debug("Listing all tables (cached)")
+                return cached
+
         logger.debug("Listing all tables")
+        loop = asyncio.get_running_loop()
 
-        # Determine which datasets to scan based on filter configuration
         if self.datasets_filter:
-            # Use only the specified datasets
-            datasets = [
-                self.client.dataset(dataset) for dataset in self.datasets_filter
-            ]
+            tables = await self._list_filtered_tables()
         else:
-            # Scan all datasets in the project
-            datasets = list(self.client.list_datasets())
-
-        logger.debug(f"Found {len(datasets)} datasets")
-
-        # Collect all tables from the selected datasets
-        tables = []
-        for dataset in datasets:
-            dataset_tables = self.client.list_tables(dataset.dataset_id)
-            # Format as fully-qualified table names
-            tables.extend(
-                [f"{dataset.dataset_id}.{table.table_id}" for table in dataset_tables]
-            )
+            # Scan all datasets in the project page by page. The table listings
+            # of a page's datasets are started as soon as the page arrives, so
+            # they overlap with fetching the next page of datasets. The next
+            # page is requested before the listings are scheduled; the executor
+            # runs tasks in FIFO order, so it would otherwise wait behind them.
+            pages = self.client.list_datasets(page_size=LIST_DATASETS_PAGE_SIZE).pages
+            pending = []
+            next_page = loop.run_in_executor(None, next, pages, None)
+            while (page := await next_page) is not None:
+                next_page = loop.run_in_executor(None, next, pages, None)
+                pending.extend(
+                    loop.run_in_executor(
+                        None, self._list_dataset_tables, dataset.dataset_id
+                    )
+                    for dataset in page
+                )
+            logger.debug("Found %d datasets", len(pending))
 
-        logger.debug(f"Found {len(tables)} tables")
+            # Collect the table listings in dataset order
+            dataset_tables = await asyncio.gather(*pending)
+            tables = [table for tables in dataset_tables for table in tables]
+
+        logger.debug("Found %d tables", len(tables))
+        with self._cache_lock:
+            self._tables_cache[_TABLES_CACHE_KEY] = tables
         return tables
 
-    def describe_table(self, table_name: str) -> list[dict[str, Any]]:
+    async def _list_filtered_tables(self) -> list[str]:
+        """
+        List the tables of all datasets in datasets_filter.
+
+        The tables of all datasets are first fetched in one round trip from the
+        regional INFORMATION_SCHEMA. That view requires project-level
+        permissions and only covers datasets in the configured location, so
+        every dataset missing from its result (view not accessible, dataset in
+        another location, empty or non-existent) is listed through the REST
+        API instead, concurrently in the default executor. Once the view has
+        raised Forbidden, it is skipped until invalidate() is called.
+
+        Returns:
+            List of fully-qualified table names in format 'dataset_id.table_id',
+            in datasets_filter order
+
+        Raises:
+            NotFound: If a dataset does not exist
+        """
+        from google.api_core.exceptions import Forbidden
+
+        loop = asyncio.get_running_loop()
+        dataset_tables: dict[str, list[str]] = {}
+        rows = []
+        if not self._regional_view_forbidden(None):
+            try:
+                rows = await loop.run_in_executor(
+                    None,
+                    lambda: list(
+                        self._execute_query_blocking(
+                            self._list_tables_query, params=self._list_tables_params
+                        )
+                    ),
+                )
+            except Forbidden as e:
+                self._mark_regional_view_forbidden(
+                    None, e, "listing datasets individually"
+                )
+        for row in rows:
+            dataset_id = row["table_schema"]
+            dataset_tables.setdefault(dataset_id, []).append(
+                f"{dataset_id}.{row['table_name']}"
+            )
+
+        missing = [ds for ds in self.datasets_filter if ds not in dataset_tables]
+        if missing:
+            logger.debug("Listing %d datasets through the REST API", len(missing))
+            listings = await asyncio.gather(
+                *[
+                    loop.run_in_executor(None, self._list_dataset_tables, dataset_id)
+                    for dataset_id in missing
+                ]
+            )
+            dataset_tables.update(zip(missing, listings))
+
+        return [
+            table
+            for dataset_id in self.datasets_filter
+            for table in dataset_tables[dataset_id]
+        ]
+
+    def _list_dataset_tables(self, dataset_id: str) -> list[str]:
+        """
+        List the tables of a single dataset (blocking).
+
+        Args:
+            dataset_id: ID of the dataset to list
+
+        Returns:
+            List of fully-qualified table names in format 'dataset_id.table_id'
+        """
+        # Consume the paginated iterator here so that all API calls happen in
+        # the calling worker thread
+        return [
+            f"{dataset_id}.{table.table_id}"
+            for table in self.client.list_tables(
+                dataset_id, page_size=LIST_TABLES_PAGE_SIZE
+            )
+        ]
+
+    async def describe_table(
+        self, table_name: str, refresh: bool = False
+    ) -> list[dict[str, Any]]:
         """
         Retrieve the schema and DDL for a specific table.
 
+        The metadata query runs in a worker thread so the event loop is not
+        blocked while waiting for BigQuery.
+
         Args:
             table_name: Fully-qualified table name in format 'dataset.table' or
                        'project.dataset.table'
+            refresh: If True, bypass the cache and query BigQuery again
 
         Returns:
             List containing a single dictionary with the table's DDL (Data Definition Language)
@@ -211,44 +776,440 @@ class BigQueryDatabase:
 
         Raises:
             ValueError: If table_name format is invalid
+            NotFound: If the table's dataset does not exist
 
         Note:
-            Uses INFORMATION_SCHEMA.TABLES to retrieve metadata, which requires
-            appropriate BigQuery permissions.
+            Uses the regional INFORMATION_SCHEMA.TABLES view of the table's
+            project (the client project for 'dataset.table' names) to retrieve
+            metadata, which requires project-level permissions. If that view
+            is not accessible or does not contain the table, the dataset's own
+            INFORMATION_SCHEMA.TABLES view is queried instead; a regional
+            view that raised Forbidden is skipped from then on (per project,
+            until invalidate()). Results are cached per table name for
+            cache_ttl seconds.
         """
-        logger.debug(f"Describing table: {table_name}")
+        # Serve cache hits on the event loop, without waiting for a worker
+        if not refresh:
+            with self._cache_lock:
+                cached = self._ddl_cache.get(table_name)
+            if cached is not None:
+                logger.debug("Describing table: %s (cached)", table_name)
+                return cached
 
-        # Parse the table name to extract dataset and table components
-        parts = table_name.split(".")
-        if len(parts) != 2 and len(parts) != 3:
-            raise ValueError(f"Invalid table name: {table_name}")
+        return await asyncio.to_thread(self._describe_table_blocking, table_name)
+
+    def _describe_table_blocking(self, table_name: str) -> list[dict[str, Any]]:
+        """
+        Query the DDL of a table and cache it (blocking, run in a worker thread).
+        """
+        logger.debug("Describing table: %s", table_name)
+        project_id, dataset_id, table_id = _parse_table_name(table_name)
+
+        # Query INFORMATION_SCHEMA for table DDL. Only the (validated) project
+        # is part of the query text; dataset and table are bound parameters.
+        if project_id is None:
+            query = self._describe_table_query
+        else:
+            query = _DESCRIBE_TABLE_SQL.format(
+                info_schema=self._project_info_schema(project_id)
+            )
+
+        from google.api_core.exceptions import Forbidden
+        from google.cloud import bigquery
+
+        params = [
+            bigquery.ScalarQueryParameter("dataset_id", "STRING", dataset_id),
+            bigquery.ScalarQueryParameter("table_name", "STRING", table_id),
+        ]
+        forbidden = None
+        results = []
+        if self._regional_view_forbidden(project_id):
+            # Known to fail; raised below if there is no dataset view to try
+            forbidden = Forbidden("Regional INFORMATION_SCHEMA view not accessible")
+        else:
+            try:
+                results = list(self._execute_query_blocking(query, params=params))
+            except Forbidden as e:
+                self._mark_regional_view_forbidden(
+                    project_id, e, "describing tables via their dataset"
+                )
+                forbidden = e
+
+        if not results:
+            # The regional view needs project-level permissions and only covers
+            # the configured location. Retry with the dataset's own view, which
+            # also raises NotFound for datasets that do not exist.
+            info_schema = self._dataset_info_schema(project_id, dataset_id)
+            if info_schema is not None:
+                logger.debug("Describing table %s via its dataset", table_name)
+                results = list(
+                    self._execute_query_blocking(
+                        _DESCRIBE_TABLE_SQL.format(info_schema=info_schema),
+                        params=params,
+                    )
+                )
+            elif forbidden is not None:
+                raise forbidden
+
+        with self._cache_lock:
+            self._ddl_cache[table_name] = results
+        return results
+
+    async def describe_tables(
+        self, table_names: list[str], refresh: bool = False
+    ) -> dict[str, str | None]:
+        """
+        Retrieve the DDL of several tables at once.
+
+        Tables that are not cached are looked up with one INFORMATION_SCHEMA
+        query per project rather than one query per table; the queries for
+        different projects run concurrently in worker threads, as do the
+        per-dataset retries for tables the regional views did not return.
+
+        Args:
+            table_names: Table names in format 'dataset.table' or
+                        'project.dataset.table'
+            refresh: If True, bypass the cache and query BigQuery again
+
+        Returns:
+            Dictionary mapping each requested table name to its DDL statement,
+            or to None if the table does not exist or is not accessible
+
+        Raises:
+            ValueError: If any table name format is invalid
+
+        Note:
+            Shares the per-table cache with describe_table. Tables the regional
+            view does not return are retried per dataset, as in describe_table.
+        """
+        # Validate all names before issuing any query; dict keys also drop
+        # duplicates while keeping the requested order
+        parsed = {name: _parse_table_name(name) for name in table_names}
+
+        ddls: dict[str, str | None] = {}
+        pending: dict[str | None, dict[str, tuple[str, str]]] = {}
+        with self._cache_lock:
+            for name, (project_id, dataset_id, table_id) in parsed.items():
+                cached = None if refresh else self._ddl_cache.get(name)
+                if cached is None:
+                    pending.setdefault(project_id, {})[name] = (dataset_id, table_id)
+                else:
+                    ddls[name] = cached[0]["ddl"] if cached else None
+
+        logger.debug(
+            "Describing %d tables (%d cached)", len(parsed), len(parsed) - len(ddls)
+        )
+        project_ddls = await asyncio.gather(
+            *[
+                asyncio.to_thread(self._describe_project_tables, project_id, tables)
+                for project_id, tables in pending.items()
+            ]
+        )
+        for found in project_ddls:
+            ddls.update(found)
+
+        # Tables the regional views did not return (view not accessible,
+        # dataset in another location, or nonexistent) are looked up in their
+        # dataset's own view, one query per dataset, all datasets concurrently
+        missing: dict[tuple[str | None, str], dict[str, str]] = {}
+        for project_id, tables in pending.items():
+            for name, (dataset_id, table_id) in tables.items():
+                if ddls[name] is None:
+                    missing.setdefault((project_id, dataset_id), {})[
+                        f"{dataset_id}.{table_id}"
+                    ] = name
+        dataset_ddls = await asyncio.gather(
+            *[
+                asyncio.to_thread(
+                    self._describe_dataset_tables, project_id, dataset_id, requested
+                )
+                for (project_id, dataset_id), requested in missing.items()
+            ]
+        )
+        for found in dataset_ddls:
+            ddls.update(found)
+
+        # Cache entries in the same row format as describe_table results
+        with self._cache_lock:
+            for tables in pending.values():
+                for name in tables:
+                    ddl = ddls[name]
+                    self._ddl_cache[name] = [] if ddl is None else [{"ddl": ddl}]
+        return {name: ddls[name] for name in parsed}
+
+    def _describe_project_tables(
+        self, project_id: str | None, tables: dict[str, tuple[str, str]]
+    ) -> dict[str, str | None]:
+        """
+        Look up the DDL of several tables of one project in its regional view
+        (blocking).
+
+        Args:
+            project_id: Project of the tables, or None for the client project
+            tables: Mapping of requested table names to (dataset_id, table_id)
+
+        Returns:
+            Dictionary mapping each requested table name to its DDL, or to None
+            if the regional view did not return it
+        """
+        from google.api_core.exceptions import Forbidden
+
+        if project_id is None:
+            info_schema = self._info_schema
+        else:
+            info_schema = self._project_info_schema(project_id)
+
+        # Map 'dataset.table' as returned by the query back to requested names
+        requested = {
+            f"{dataset}.{table}": name for name, (dataset, table) in tables.items()
+        }
+        ddls: dict[str, str | None] = dict.fromkeys(tables)
+        if not self._regional_view_forbidden(project_id):
+            try:
+                self._fetch_ddls(info_schema, requested, ddls)
+            except Forbidden as e:
+                self._mark_regional_view_forbidden(
+                    project_id, e, "describing tables per dataset"
+                )
+        return ddls
+
+    def _describe_dataset_tables(
+        self, project_id: str | None, dataset_id: str, requested: dict[str, str]
+    ) -> dict[str, str | None]:
+        """
+        Look up the DDL of several tables of one dataset in the dataset's own
+        view (blocking).
+
+        Args:
+            project_id: Project of the dataset, or None for the client project
+            dataset_id: Dataset of the tables
+            requested: Mapping of 'dataset.table' to the requested table name
+
+        Returns:
+            Dictionary mapping the requested names of the tables found to their
+            DDL. Empty if the dataset does not exist or is not accessible.
+        """
+        from google.api_core.exceptions import Forbidden, NotFound
+
+        ddls: dict[str, str | None] = {}
+        info_schema = self._dataset_info_schema(project_id, dataset_id)
+        if info_schema is None:
+            return ddls
+        try:
+            self._fetch_ddls(info_schema, requested, ddls)
+        except (NotFound, Forbidden) as e:
+            # The dataset's tables stay None
+            logger.debug("Dataset %s not accessible: %s", dataset_id, e)
+        return ddls
 
-        # Handle both 'dataset.table' and 'project.dataset.table' formats
-        dataset_id = ".".join(parts[:-1])
-        table_id = parts[-1]
+    def _fetch_ddls(
+        self,
+        info_schema: str,
+        requested: dict[str, str],
+        ddls: dict[str, str | None],
+    ) -> None:
+        """
+        Query an INFORMATION_SCHEMA.TABLES view for the DDL of several tables.
 
-        # Query INFORMATION_SCHEMA for table DDL
-        # Using parameterized query for security
-        query = f"""
-            SELECT ddl
-            FROM {dataset_id}.INFORMATION_SCHEMA.TABLES
-            WHERE table_name = @table_name;
+        Args:
+            info_schema: Regional or dataset-qualified view to query
+            requested: Mapping of 'dataset.table' to the requested table name
+            ddls: Result mapping of requested table names to DDL, updated in
+                 place for every table found
         """
-        return self.execute_query(
-            query,
+        from google.cloud import bigquery
+
+        datasets = sorted({fqn.split(".", 1)[0] for fqn in requested})
+        rows = self._execute_query_blocking(
+            _DESCRIBE_TABLES_SQL.format(info_schema=info_schema),
             params=[
-                bigquery.ScalarQueryParameter("table_name", "STRING", table_id),
+                bigquery.ArrayQueryParameter("datasets", "STRING", datasets),
+                bigquery.ArrayQueryParameter("tables", "STRING", list(requested)),
             ],
         )
+        for row in rows:
+            ddls[requested[row["fqn"]]] = row["ddl"]
+
+    def _dataset_info_schema(
+        self, project_id: str | None, dataset_id: str
+    ) -> str | None:
+        """
+        Return the INFORMATION_SCHEMA.TABLES view of a single dataset.
+
+        Unlike the regional view, it only requires access to the dataset itself
+        and works regardless of the configured location.
+
+        Returns:
+            The view name, or None if dataset_id contains characters outside
+            _DATASET_ID_RE (no such dataset can exist, and the ID would have to
+            be interpolated into the query text)
+        """
+        if _DATASET_ID_RE.fullmatch(dataset_id) is None:
+            return None
+        project = project_id or self.client.project
+        return f"`{project}`.`{dataset_id}`.INFORMATION_SCHEMA.TABLES"
+
+    def _project_info_schema(self, project_id: str) -> str:
+        """
+        Return the regional INFORMATION_SCHEMA.TABLES view of a project.
+        """
+        return f"`{project_id}`.`{self._region}`.INFORMATION_SCHEMA.TABLES"
+
+
+# ============================================================================
+# MCP Tool Catalog
+# ============================================================================
+# The tool definitions never change at runtime, so they are built once at
+# import time and returned as-is on every tools/list request.
+
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="execute-query",
+        description="Execute a SELECT query on the BigQuery database",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "SELECT SQL query to execute using BigQuery dialect",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    types.Tool(
+        name="list-tables",
+        description="List all tables in the BigQuery database",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Bypass the cache and fetch a fresh table list",
+                },
+            },
+        },
+    ),
+    types.Tool(
+        name="describe-table",
+        description="Get the schema information for a specific table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table to describe (e.g. my_dataset.my_table)",
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Bypass the cache and fetch a fresh table description",
+                },
+            },
+            "required": ["table_name"],
+        },
+    ),
+    types.Tool(
+        name="describe-tables",
+        description="Get the schema information for several tables in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "description": "Names of the tables to describe (e.g. my_dataset.my_table)",
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Bypass the cache and fetch fresh table descriptions",
+                },
+            },
+            "required": ["table_names"],
+        },
+    ),
+]
+
+
+# ============================================================================
+# MCP Tool Handlers
+# ============================================================================
+# One coroutine per tool. Each validates its own arguments, calls into
+# BigQueryDatabase and returns the MCP content for the result.
+
+ToolResult = list[types.TextContent | types.ImageContent | types.EmbeddedResource]
+
+
+async def _handle_list_tables(
+    db: BigQueryDatabase, arguments: dict[str, Any]
+) -> ToolResult:
+    """
+    Handle the list-tables tool.
+    """
+    results = await db.list_tables(refresh=bool(arguments.get("refresh")))
+    return [types.TextContent(type="text", text=_to_json(results))]
+
+
+async def _handle_describe_table(
+    db: BigQueryDatabase, arguments: dict[str, Any]
+) -> ToolResult:
+    """
+    Handle the describe-table tool.
+    """
+    if "table_name" not in arguments:
+        raise ValueError("Missing table_name argument")
+    results = await db.describe_table(
+        arguments["table_name"], refresh=bool(arguments.get("refresh"))
+    )
+    return [types.TextContent(type="text", text=_to_json(results))]
+
+
+async def _handle_describe_tables(
+    db: BigQueryDatabase, arguments: dict[str, Any]
+) -> ToolResult:
+    """
+    Handle the describe-tables tool.
+    """
+    if "table_names" not in arguments:
+        raise ValueError("Missing table_names argument")
+    results = await db.describe_tables(
+        arguments["table_names"], refresh=bool(arguments.get("refresh"))
+    )
+    return [types.TextContent(type="text", text=_to_json(results))]
+
+
+async def _handle_execute_query(
+    db: BigQueryDatabase, arguments: dict[str, Any]
+) -> ToolResult:
+    """
+    Handle the execute-query tool.
+    """
+    if "query" not in arguments:
+        raise ValueError("Missing query argument")
+    chunks = await db.execute_query(arguments["query"])
+    return [types.TextContent(type="text", text=chunk) for chunk in chunks]
+
+
+# Maps tool names to their handlers
+_TOOL_HANDLERS: dict[
+    str, Callable[[BigQueryDatabase, dict[str, Any]], Awaitable[ToolResult]]
+] = {
+    "list-tables": _handle_list_tables,
+    "describe-table": _handle_describe_table,
+    "describe-tables": _handle_describe_tables,
+    "execute-query": _handle_execute_query,
+}
 
 
 async def main(
     project: str,
     location: str,
-    key_file: Optional[str],
+    key_file: str | None,
     datasets_filter: list[str],
     transport: str = "stdio",
     port: int = 8080,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    max_bytes_billed: int | None = None,
 ):
     """
     Main entry point for the BigQuery MCP Server.
@@ -263,18 +1224,33 @@ async def main(
         datasets_filter: List of datasets to restrict access to
         transport: Transport type - 'stdio' for local/CLI use, 'http'/'sse' for cloud deployment
         port: Port number for HTTP/SSE transport (ignored for stdio)
+        cache_ttl: Seconds for which table metadata is cached (0 disables caching)
+        max_bytes_billed: Upper limit of bytes billed per execute-query call
+                         (None for no limit)
 
     Transport modes:
         - stdio: Standard input/output, used for local MCP client connections
         - http/sse: Server-Sent Events over HTTP, used for cloud deployments (e.g., Cloud Run)
     """
     logger.info(
-        f"Starting BigQuery MCP Server with project: {project} and location: {location}"
+        "Starting BigQuery MCP Server with project: %s and location: %s",
+        project,
+        location,
+    )
+    logger.info("Using transport: %s", transport)
+
+    # All blocking BigQuery calls are dispatched to the loop's default executor
+    # (asyncio.to_thread, run_in_executor); size it for I/O-bound work
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(
+            max_workers=WORKER_THREADS, thread_name_prefix="bigquery"
+        )
     )
-    logger.info(f"Using transport: {transport}")
 
     # Initialize BigQuery database client
-    db = BigQueryDatabase(project, location, key_file, datasets_filter)
+    db = BigQueryDatabase(
+        project, location, key_file, datasets_filter, cache_ttl, max_bytes_billed
+    )
 
     # Create MCP server instance
     server = Server("bigquery-manager")
@@ -291,50 +1267,14 @@ async def main(
 
         Returns the catalog of tools that LLMs can invoke to interact with BigQuery.
         Each tool includes its name, description, and input schema for validation.
+        The catalog is immutable and built once at import time (see _TOOLS).
         """
-        return [
-            types.Tool(
-                name="execute-query",
-                description="Execute a SELECT query on the BigQuery database",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "SELECT SQL query to execute using BigQuery dialect",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            ),
-            types.Tool(
-                name="list-tables",
-                description="List all tables in the BigQuery database",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                },
-            ),
-            types.Tool(
-                name="describe-table",
-                description="Get the schema information for a specific table",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "table_name": {
-                            "type": "string",
-                            "description": "Name of the table to describe (e.g. my_dataset.my_table)",
-                        },
-                    },
-                    "required": ["table_name"],
-                },
-            ),
-        ]
+        return _TOOLS
 
     @server.call_tool()
     async def handle_call_tool(
         name: str, arguments: dict[str, Any] | None
-    ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    ) -> ToolResult:
         """
         Handler for executing MCP tool calls.
 
@@ -352,33 +1292,31 @@ async def main(
             All exceptions are caught and returned as error messages to prevent
             server crashes from malformed queries or permission issues.
         """
-        logger.debug(f"Handling tool execution request: {name}")
+        logger.debug("Handling tool execution request: %s", name)
 
         try:
             # Route to appropriate handler based on tool name
-            if name == "list-tables":
-                results = db.list_tables()
-                return [types.TextContent(type="text", text=str(results))]
-
-            elif name == "describe-table":
-                if not arguments or "table_name" not in arguments:
-                    raise ValueError("Missing table_name argument")
-                results = db.describe_table(arguments["table_name"])
-                return [types.TextContent(type="text", text=str(results))]
-
-            elif name == "execute-query":
-                if not arguments or "query" not in arguments:
-                    raise ValueError("Missing query argument")
-                results = db.execute_query(arguments["query"])
-                return [types.TextContent(type="text", text=str(results))]
-
-            else:
+            handler = _TOOL_HANDLERS.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
+            return await handler(db, arguments or {})
         except Exception as e:
             # Return errors as text content rather than raising exceptions
             # This prevents the MCP server from crashing on invalid requests
             return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
+    # Initialization options are identical for every client connection.
+    # Capabilities are derived from the registered handlers, so they are
+    # computed once here, after registration.
+    init_options = InitializationOptions(
+        server_name="bigquery",
+        server_version="0.3.0",
+        capabilities=server.get_capabilities(
+            notification_options=NotificationOptions(),
+            experimental_capabilities={},
+        ),
+    )
+
     # ========================================================================
     # Transport Layer Setup
     # ========================================================================
@@ -386,13 +1324,23 @@ async def main(
     if transport == "http" or transport == "sse":
         # HTTP/SSE transport for cloud deployments (e.g., Google Cloud Run, Kubernetes)
         # This mode exposes the MCP server over HTTP using Server-Sent Events
-        logger.info(f"Starting HTTP server on port {port}")
+        logger.info("Starting HTTP server on port %d", port)
 
+        # HTTP-only dependencies are imported here so that stdio mode does not
+        # pay for them
+        from mcp.server.sse import SseServerTransport
+        from starlette.applications import Starlette
+        from starlette.responses import Response
         from starlette.routing import Route
 
         # Initialize SSE transport for bidirectional MCP communication over HTTP
         sse = SseServerTransport("/messages")
 
+        # The health check payload is constant, so it is serialized only once
+        health_body = _to_json(
+            {"status": "healthy", "service": "bigquery-mcp-server"}
+        ).encode()
+
         async def handle_sse(request):
             """
             Handle SSE connections for MCP communication.
@@ -403,18 +1351,7 @@ async def main(
             async with sse.connect_sse(
                 request.scope, request.receive, request._send
             ) as streams:
-                await server.run(
-                    streams[0],
-                    streams[1],
-                    InitializationOptions(
-                        server_name="bigquery",
-                        server_version="0.3.0",
-                        capabilities=server.get_capabilities(
-                            notification_options=NotificationOptions(),
-                            experimental_capabilities={},
-                        ),
-                    ),
-                )
+                await server.run(streams[0], streams[1], init_options)
 
         async def handle_post(request):
             """
@@ -423,8 +1360,6 @@ async def main(
             Receives tool invocation requests and other client messages.
             Returns 202 Accepted to indicate the message was queued for processing.
             """
-            from starlette.responses import Response
-
             await sse.handle_post_message(request.scope, request.receive, request._send)
             return Response(status_code=202)
 
@@ -435,9 +1370,7 @@ async def main(
             Used by Cloud Run, Kubernetes, and load balancers to verify
             the service is running and ready to accept requests.
             """
-            from starlette.responses import JSONResponse
-
-            return JSONResponse({"status": "healthy", "service": "bigquery-mcp-server"})
+            return Response(content=health_body, media_type="application/json")
 
         # Create Starlette ASGI application with route definitions
         app = Starlette(
@@ -453,10 +1386,23 @@ async def main(
 
         import uvicorn
 
-        # Start the HTTP server using uvicorn ASGI server
-        logger.info(f"Server ready on http://0.0.0.0:{port}")
+        # Start the HTTP server using uvicorn ASGI server. It runs inside the
+        # current (uvloop, if available) event loop and uses the C-based
+        # httptools parser; per-request access logs are disabled since they
+        # would write to stdout for every SSE message and health probe.
+        # A single worker is used on purpose: SSE sessions live in this
+        # process, so POSTs must reach the process holding the stream.
+        logger.info("Server ready on http://0.0.0.0:%d", port)
         await uvicorn.Server(
-            uvicorn.Config(app, host="0.0.0.0", port=port, log_level="info")
+            uvicorn.Config(
+                app,
+                host="0.0.0.0",
+                port=port,
+                log_level="info",
+                http="httptools",
+                access_log=False,
+                server_header=False,
+            )
         ).serve()
     else:
         # ====================================================================
@@ -466,15 +1412,4 @@ async def main(
         # This is the default mode for desktop applications and CLI tools
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             logger.info("Server running with stdio transport")
-            await server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="bigquery",
-                    server_version="0.3.0",
-                    capabilities=server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={},
-                    ),
-                ),
-            )
+            await server.run(read_stream, write_stream, init_options)
@@ -0,0 +1,317 @@
+"""
+Unit tests for the metadata lookups of BigQueryDatabase.
+
+The BigQuery client is replaced by a mock whose query_and_wait answers the
+INFORMATION_SCHEMA queries from an in-memory catalog, so the regional and
+dataset-qualified view fallbacks can be exercised without a project.
+"""
+
+import asyncio
+import re
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import Forbidden, NotFound
+
+from mcp_server_bigquery.server import BigQueryDatabase
+
+PROJECT = "test-project"
+
+# Tables (with DDL) per (project, dataset)
+CATALOG = {
+    (PROJECT, "sales"): {
+        "orders": "CREATE TABLE orders",
+        "items": "CREATE TABLE items",
+    },
+    (PROJECT, "hr"): {"staff": "CREATE TABLE staff"},
+    ("other-project", "logs"): {"events": "CREATE TABLE events"},
+}
+
+
+class FakeRowIterator(list):
+    """List of rows with the schema and total_rows of a RowIterator."""
+
+    def __init__(self, columns, rows):
+        super().__init__(SimpleNamespace(_xxx_values=tuple(row)) for row in rows)
+        self.schema = [SimpleNamespace(name=name) for name in columns]
+        self.total_rows = len(rows)
+
+
+class FakeBigQuery:
+    """
+    Answers INFORMATION_SCHEMA queries and table listings from CATALOG.
+
+    Attributes:
+        regional_forbidden: Projects whose regional view raises Forbidden
+        regional_datasets: Datasets covered by the regional view (i.e. in the
+                          configured location); None for all of them
+        forbidden_datasets: Datasets whose own view raises Forbidden
+        views: Views queried so far, in order
+    """
+
+    def __init__(self):
+        self.regional_forbidden: set[str] = set()
+        self.regional_datasets: set[str] | None = None
+        self.forbidden_datasets: set[str] = set()
+        self.views: list[str] = []
+
+    def query_and_wait(self, query, job_config=None):
+        project, view = re.search(r"FROM `([^`]+)`\.`([^`]+)`", query).groups()
+        self.views.append(f"{project}.{view}")
+        params = {
+            p.name: getattr(p, "values", None) for p in job_config.query_parameters
+        }
+        scalars = {
+            p.name: getattr(p, "value", None) for p in job_config.query_parameters
+        }
+
+        if view.startswith("region-"):
+            if project in self.regional_forbidden:
+                raise Forbidden("Access Denied: regional INFORMATION_SCHEMA")
+            datasets = {
+                ds
+                for (proj, ds) in CATALOG
+                if proj == project
+                and (self.regional_datasets is None or ds in self.regional_datasets)
+            }
+        else:
+            if view in self.forbidden_datasets:
+                raise Forbidden(f"Access Denied: dataset {view}")
+            if (project, view) not in CATALOG:
+                raise NotFound(f"Not found: Dataset {project}:{view}")
+            datasets = {view}
+
+        tables = [
+            (ds, name, ddl)
+            for (proj, ds), ds_tables in sorted(CATALOG.items())
+            if proj == project and ds in datasets
+            for name, ddl in sorted(ds_tables.items())
+        ]
+        if "fqn" in query:
+            # Batched describe query
+            return FakeRowIterator(
+                ["fqn", "ddl"],
+                [
+                    (f"{ds}.{name}", ddl)
+                    for ds, name, ddl in tables
+                    if ds in params["datasets"] and f"{ds}.{name}" in params["tables"]
+                ],
+            )
+        if "ddl" in query:
+            # Single table describe query
+            return FakeRowIterator(
+                ["ddl"],
+                [
+                    (ddl,)
+                    for ds, name, ddl in tables
+                    if ds == scalars["dataset_id"] and name == scalars["table_name"]
+                ],
+            )
+        # Filtered table listing
+        return FakeRowIterator(
+            ["table_schema", "table_name"],
+            [(ds, name) for ds, name, _ in tables if ds in params["datasets"]],
+        )
+
+    def list_tables(self, dataset_id, page_size=None):
+        if (PROJECT, dataset_id) not in CATALOG:
+            raise NotFound(f"Not found: Dataset {PROJECT}:{dataset_id}")
+        return [
+            SimpleNamespace(table_id=name)
+            for name in sorted(CATALOG[(PROJECT, dataset_id)])
+        ]
+
+
+@pytest.fixture
+def fake():
+    return FakeBigQuery()
+
+
+@pytest.fixture
+def make_db(fake):
+    """Create a BigQueryDatabase whose client is backed by the fake."""
+
+    def make(datasets_filter=()):
+        with mock.patch("google.cloud.bigquery.Client") as client_cls:
+            client = client_cls.return_value
+            client.project = PROJECT
+            client.query_and_wait.side_effect = fake.query_and_wait
+            client.list_tables.side_effect = fake.list_tables
+            return BigQueryDatabase(PROJECT, "EU", None, list(datasets_filter))
+
+    return make
+
+
+def regional(project=PROJECT):
+    return f"{project}.region-eu"
+
+
+# ============================================================================
+# list_tables
+# ============================================================================
+
+
+def test_list_tables_single_regional_query(fake, make_db):
+    db = make_db(["sales", "hr"])
+
+    tables = asyncio.run(db.list_tables())
+
+    # datasets_filter order, not the query's ORDER BY
+    assert tables == ["sales.items", "sales.orders", "hr.staff"]
+    assert fake.views == [regional()]
+    db.client.list_tables.assert_not_called()
+
+
+def test_list_tables_lists_datasets_missing_from_regional_view(fake, make_db):
+    fake.regional_datasets = {"sales"}
+    db = make_db(["hr", "sales"])
+
+    tables = asyncio.run(db.list_tables())
+
+    assert tables == ["hr.staff", "sales.items", "sales.orders"]
+    assert [c.args[0] for c in db.client.list_tables.call_args_list] == ["hr"]
+
+
+def test_list_tables_regional_forbidden_is_remembered(fake, make_db):
+    fake.regional_forbidden = {PROJECT}
+    db = make_db(["sales", "hr"])
+
+    async def run():
+        return await db.list_tables(), await db.list_tables(refresh=True)
+
+    first, second = asyncio.run(run())
+
+    assert first == second == ["sales.items", "sales.orders", "hr.staff"]
+    # The regional view is only tried once
+    assert fake.views == [regional()]
+
+
+def test_list_tables_missing_dataset_raises_not_found(make_db):
+    db = make_db(["sales", "missing"])
+
+    with pytest.raises(NotFound):
+        asyncio.run(db.list_tables())
+
+
+# ============================================================================
+# describe_table
+# ============================================================================
+
+
+def test_describe_table_regional_view(fake, make_db):
+    db = make_db()
+
+    assert asyncio.run(db.describe_table("sales.orders")) == [
+        {"ddl": "CREATE TABLE orders"}
+    ]
+    assert fake.views == [regional()]
+
+
+def test_describe_table_retries_dataset_view(fake, make_db):
+    fake.regional_datasets = set()
+    db = make_db()
+
+    result = asyncio.run(db.describe_table("other-project.logs.events"))
+
+    assert result == [{"ddl": "CREATE TABLE events"}]
+    assert fake.views == [regional("other-project"), "other-project.logs"]
+
+
+def test_describe_table_regional_forbidden_is_remembered(fake, make_db):
+    fake.regional_forbidden = {PROJECT}
+    db = make_db()
+
+    async def run():
+        return [await db.describe_table(name) for name in ("sales.orders", "hr.staff")]
+
+    assert asyncio.run(run()) == [
+        [{"ddl": "CREATE TABLE orders"}],
+        [{"ddl": "CREATE TABLE staff"}],
+    ]
+    assert fake.views == [regional(), f"{PROJECT}.sales", f"{PROJECT}.hr"]
+
+
+def test_describe_table_missing_dataset_raises_not_found(make_db):
+    db = make_db()
+
+    with pytest.raises(NotFound):
+        asyncio.run(db.describe_table("missing.orders"))
+
+
+def test_describe_table_is_cached(fake, make_db):
+    db = make_db()
+
+    async def run():
+        await db.describe_table("sales.orders")
+        await db.describe_table("sales.orders")
+
+    asyncio.run(run())
+    assert fake.views == [regional()]
+
+
+# ============================================================================
+# describe_tables
+# ============================================================================
+
+
+def test_describe_tables_one_query_per_project(fake, make_db):
+    db = make_db()
+    names = ["hr.staff", "other-project.logs.events", "sales.orders", "sales.nope"]
+
+    ddls = asyncio.run(db.describe_tables(names))
+
+    assert list(ddls) == names
+    assert ddls == {
+        "hr.staff": "CREATE TABLE staff",
+        "other-project.logs.events": "CREATE TABLE events",
+        "sales.orders": "CREATE TABLE orders",
+        "sales.nope": None,
+    }
+    # One regional query per project, plus the dataset retry for the table
+    # the regional view did not return
+    assert sorted(fake.views) == sorted(
+        [regional(), regional("other-project"), f"{PROJECT}.sales"]
+    )
+
+
+def test_describe_tables_shares_describe_table_cache(fake, make_db):
+    db = make_db()
+
+    async def run():
+        await db.describe_tables(["sales.orders", "sales.nope"])
+        return await db.describe_table("sales.orders"), await db.describe_table(
+            "sales.nope"
+        )
+
+    assert asyncio.run(run()) == ([{"ddl": "CREATE TABLE orders"}], [])
+    assert fake.views == [regional(), f"{PROJECT}.sales"]
+
+
+def test_describe_tables_regional_forbidden(fake, make_db):
+    fake.regional_forbidden = {PROJECT}
+    fake.forbidden_datasets = {"hr"}
+    db = make_db()
+
+    ddls = asyncio.run(
+        db.describe_tables(["sales.orders", "hr.staff", "missing.table"])
+    )
+
+    # Inaccessible and nonexistent datasets leave their tables None
+    assert ddls == {
+        "sales.orders": "CREATE TABLE orders",
+        "hr.staff": None,
+        "missing.table": None,
+    }
+    assert fake.views[0] == regional()
+    assert sorted(fake.views[1:]) == sorted(
+        [f"{PROJECT}.sales", f"{PROJECT}.hr", f"{PROJECT}.missing"]
+    )
+
+
+def test_describe_tables_rejects_invalid_names(make_db):
+    db = make_db()
+
+    with pytest.raises(ValueError):
+        asyncio.run(db.describe_tables(["sales.orders", "no_dataset"]))
+    db.client.query_and_wait.assert_not_called()